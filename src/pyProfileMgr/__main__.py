@@ -34,26 +34,25 @@
 ################################################################################
 
 import sys
-import argparse
-import logging
-
-# Import command modules
-from pyProfileMgr import cmd_profile
+from typing import Container, Optional, TYPE_CHECKING
 
 from pyProfileMgr.ret import Ret
 from pyProfileMgr.version import __version__, __author__, __email__, __repository__, __license__
 
+# argparse, logging and the command modules are imported on demand
+# to keep the startup time of the CLI low.
+if TYPE_CHECKING:
+    import argparse
+
 
 ################################################################################
 # Variables
 ################################################################################
 
-LOG: logging.Logger = logging.getLogger(__name__)
-
-# Add command modules here
-_CMD_MODULES = [
-    cmd_profile,
-]
+# Add command modules here: command name -> (module path, help text)
+_CMD_MODULES: dict[str, tuple[str, str]] = {
+    "profile": ("pyProfileMgr.cmd_profile", "Add, update or delete server profiles."),
+}
 
 PROG_NAME = "pyProfileMgr"
 PROG_DESC = "A library containing the Profile Manager and providing a CLI for creating/updating/deleting profiles."
@@ -71,16 +70,52 @@ PROG_EPILOG = PROG_COPYRIGHT + " - " + PROG_GITHUB
 # Functions
 ################################################################################
 
-def add_parser() -> argparse.ArgumentParser:
+def _sniff_subcommand(argv: list[str], valid_names: Container[str]) -> Optional[str]:
+    """ Determines the command selected on the command line without parsing it.
+
+        Global options are skipped, the first positional argument is the command.
+
+    Args:
+        argv ([str]): The command line arguments without the program name.
+        valid_names ([str]): The names of all available commands.
+
+    Returns:
+        str: The name of the selected command or None if no valid command is given.
+    """
+    for token in argv:
+        if not token.startswith("-"):
+            return token if token in valid_names else None
+
+    return None
+
+
+def add_parser(argv: Optional[list[str]] = None) -> "argparse.ArgumentParser":
     """ Adds the parser for command line arguments and
         sets the execute function of each
         cmd module as callback for the subparser command.
         Returns the parser after all the modules have been registered
         and added their subparsers.
 
+        Only the command selected on the command line registers its full
+        subparser tree. All other commands are added as placeholders with
+        their name and help text only, which is all the top-level help and
+        error messages need. argparse never selects a placeholder, since a
+        valid command on the command line is always the sniffed one.
+
+    Args:
+        argv ([str]): The command line arguments used to select the command.
+            Defaults to the arguments of the program call.
+
     Returns:
         obj:  The parser object for command line arguments.
     """
+    # pylint: disable=import-outside-toplevel
+    import argparse
+    import importlib
+
+    if argv is None:
+        argv = sys.argv[1:]
+
     parser = argparse.ArgumentParser(prog=PROG_NAME,
                                      description=PROG_DESC,
                                      epilog=PROG_EPILOG)
@@ -95,17 +130,23 @@ def add_parser() -> argparse.ArgumentParser:
                         help="Print full command details before executing the command.\
                             Enables logs of type INFO and WARNING.")
 
-    subparser = parser.add_subparsers(required='True')
+    subparser = parser.add_subparsers(required=True)
+
+    selected_cmd = _sniff_subcommand(argv, _CMD_MODULES)
 
     # Register command modules und argparser arguments
-    for mod in _CMD_MODULES:
-        cmd_parser = mod.register(subparser)
-        cmd_parser.set_defaults(func=mod.execute)
+    for cmd_name, (mod_path, cmd_help) in _CMD_MODULES.items():
+        if cmd_name == selected_cmd:
+            mod = importlib.import_module(mod_path)
+            cmd_parser = mod.register(subparser, cmd_name, cmd_help)
+            cmd_parser.set_defaults(func=mod.execute)
+        else:
+            subparser.add_parser(cmd_name, help=cmd_help)
 
     return parser
 
 
-def main() -> Ret.CODE:
+def main() -> int:
     """ The program entry point function.
 
     Returns:
@@ -114,6 +155,11 @@ def main() -> Ret.CODE:
     ret_status = Ret.CODE.RET_OK
     args = None
 
+    # Answer a plain version request without building the parser.
+    if sys.argv[1:] == ["--version"]:
+        print(f"{PROG_NAME} {__version__}")
+        return int(ret_status)
+
     # Create the main parser and add the subparsers.
     parser = add_parser()
 
@@ -126,18 +172,22 @@ def main() -> Ret.CODE:
     else:
         # If the verbose flag is set, change the default logging level.
         if args.verbose:
+            import logging  # pylint: disable=import-outside-toplevel
+
             logging.basicConfig(level=logging.INFO)
-            LOG.info("Program arguments: ")
-            for arg in vars(args):
-                LOG.info("* %s = %s", arg, vars(args)[arg])
+            log = logging.getLogger(__name__)
+            if log.isEnabledFor(logging.INFO):
+                log.info("Program arguments: ")
+                for arg, value in vars(args).items():
+                    log.info("* %s = %s", arg, value)
 
         # Call command function and return exit status
         ret_status = args.func(args)
 
-    if ret_status is not Ret.CODE.RET_OK:
-        print(Ret.MSG[ret_status])
+    if ret_status != Ret.CODE.RET_OK:
+        sys.stderr.write(f"{Ret.MSG[ret_status]}\n")
 
-    return ret_status
+    return int(ret_status)
 
 
 ################################################################################
@@ -38,8 +38,12 @@
 ################################################################################
 
 import argparse
+import functools
 import logging
+import os
+from typing import Optional
 
+from pyProfileMgr.profile_data import ProfileType
 from pyProfileMgr.profile_mgr import ProfileMgr
 from pyProfileMgr.ret import Ret
 
@@ -49,6 +53,12 @@ from pyProfileMgr.ret import Ret
 
 LOG: logging.Logger = logging.getLogger(__name__)
 
+# The valid values of the profile type option.
+_PROFILE_TYPES = tuple(profile_type.value for profile_type in ProfileType)
+
+# The options of the update command, which are not supported yet.
+_UNSUPPORTED_UPDATE_FIELDS = ("profile_type", "server", "token", "user", "password")
+
 
 ################################################################################
 # Classes
@@ -59,19 +69,21 @@ LOG: logging.Logger = logging.getLogger(__name__)
 ################################################################################
 
 
-def register(subparser) -> argparse.ArgumentParser:
-    """ Register subparser commands for the print module.
+def register(subparser, name: str, cmd_help: str) -> argparse.ArgumentParser:
+    """ Register subparser commands for the profile module.
 
     Args:
         subparser (obj):   The command subparser object provided via __main__.py.
+        name (str):        The name of the command provided via __main__.py.
+        cmd_help (str):    The help text of the command provided via __main__.py.
 
     Returns:
         obj:    The command parser object of this module.
     """
 
     parser = subparser.add_parser(
-        'profile',
-        help="Add, update or delete server profiles."
+        name,
+        help=cmd_help
     )
 
     sub_parsers = parser.add_subparsers(required=True)
@@ -91,6 +103,7 @@ def register(subparser) -> argparse.ArgumentParser:
         '-pt',
         '--profile_type',
         type=str,
+        choices=_PROFILE_TYPES,
         required=True,
         metavar="<profile type>",
         help="The type of the profile ('jira', 'polarion', 'superset', 'conaktiv' or 'stages')."
@@ -171,6 +184,7 @@ def register(subparser) -> argparse.ArgumentParser:
         '-pt',
         '--profile_type',
         type=str,
+        choices=_PROFILE_TYPES,
         required=False,
         metavar="<profile type>",
         help="The type of the profile ('jira', 'polarion', 'superset', 'conaktiv' or 'stages')."
@@ -251,14 +265,14 @@ def _profile_add(args) -> Ret.CODE:
         Ret.CODE: The return status of the module.
     """
     ret_status = Ret.CODE.RET_OK
+    profile_mgr = ProfileMgr()
 
     # Do not overwrite existing profiles.
-    profile_mgr = ProfileMgr()
-    profile_list = profile_mgr.get_profiles()
-    if args.profile_name in profile_list:
+    if args.profile_name in _cached_profile_names(profile_mgr.profiles_folder):
         return Ret.CODE.RET_ERROR_PROFILE_ALREADY_EXISTS
 
-    ret_status = _add_profile(args)
+    ret_status = _add_profile(args, profile_mgr)
+    _cached_profile_names.cache_clear()
 
     return ret_status
 
@@ -302,17 +316,37 @@ def _profile_update(args) -> Ret.CODE:
     return _update_profile(args)
 
 
-def _add_profile(args) -> Ret.CODE:
+@functools.lru_cache(maxsize=1)
+def _cached_profile_names(profiles_folder: str) -> frozenset[str]:
+    """ Gets the names of all profiles stored in the profiles folder.
+
+        The result is cached to avoid scanning the profiles folder repeatedly.
+        Call _cached_profile_names.cache_clear() after adding or removing a profile.
+
+    Args:
+        profiles_folder (str): The path to the profiles storage folder.
+
+    Returns:
+        frozenset[str]: The names of all stored profiles.
+    """
+    with os.scandir(profiles_folder) as entries:
+        return frozenset(entry.name for entry in entries if entry.is_dir())
+
+
+def _add_profile(args, profile_mgr: Optional[ProfileMgr] = None) -> Ret.CODE:
     """ Adds a new profile to the configuration using provided arguments.
 
     Args:
         args (obj): Object containing the command line arguments for profile addition.
+        profile_mgr (ProfileMgr): The profile manager to use. A new one is created if not provided.
 
     Returns:
         Ret.CODE: Status code indicating the success or failure of the profile addition.
     """
     ret_status = Ret.CODE.RET_OK
-    profile_mgr = ProfileMgr()
+
+    if profile_mgr is None:
+        profile_mgr = ProfileMgr()
 
     if args.server is None:
         ret_status = Ret.CODE.RET_ERROR_MISSING_SERVER_URL
@@ -346,9 +380,8 @@ def _list_profiles() -> Ret.CODE:
 
     profile_list = ProfileMgr().get_profiles()
 
-    print("Profiles:")
-    for profile_name in profile_list:
-        print(f"\t{profile_name}")
+    # Write the whole list at once instead of one print() call per profile.
+    print("\n".join(["Profiles:"] + [f"\t{profile_name}" for profile_name in profile_list]))
 
     return ret_status
 
@@ -365,6 +398,7 @@ def _remove_profile(profile_name: str) -> Ret.CODE:
     ret_status = Ret.CODE.RET_OK
 
     ProfileMgr().delete(profile_name)
+    _cached_profile_names.cache_clear()
 
     return ret_status
 
@@ -380,8 +414,16 @@ def _update_profile(args) -> Ret.CODE:
     """
     ret_status = Ret.CODE.RET_OK
 
+    unsupported_fields = [field for field in _UNSUPPORTED_UPDATE_FIELDS if getattr(args, field) is not None]
+    if unsupported_fields:
+        LOG.warning("Updating '%s' is not implemented yet.", "', '".join(unsupported_fields))
+
+    # Nothing to update, so do not load the profile at all.
+    if args.cert is None:
+        ret_status = Ret.CODE.RET_ERROR_NO_UPDATE_FIELDS
+
     # Update cert
-    if args.cert is not None:
+    else:
         profile_mgr = ProfileMgr()
         ret_status = profile_mgr.load(args.profile_name)
 
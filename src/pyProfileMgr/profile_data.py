@@ -35,16 +35,16 @@
 # Imports
 ################################################################################
 
-from dataclasses import dataclass
+import sys
+from typing import NamedTuple, Optional
 
-try:
-    from enum import StrEnum  # type: ignore # Available in Python 3.11+
-except ImportError:
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:
     from enum import Enum
 
     class StrEnum(str, Enum):
         ''' Custom StrEnum class for Python versions < 3.11 '''
-from typing import Optional
 
 ################################################################################
 # Variables
@@ -60,7 +60,6 @@ from typing import Optional
 # Classes
 ################################################################################
 
-@dataclass
 class ProfileType(StrEnum):
     """ The profile types."""
     JIRA = 'jira'  # type: ignore
@@ -70,11 +69,12 @@ class ProfileType(StrEnum):
     STAGES = 'stages'  # type: ignore
 
 
-@dataclass
-class ProfileData:
-    """ Encapsulates the profile attributes like name, type, server, etc. """
+class ProfileData(NamedTuple):
+    """ Encapsulates the profile attributes like name, type, server, etc.
+        The data is immutable, use _replace() to derive modified data.
+    """
     profile_name: str
-    profile_type: str
+    profile_type: ProfileType
     server_url: str
     token: Optional[str]
     user: Optional[str]
@@ -35,24 +35,35 @@
 # Imports
 ################################################################################
 
-import copy
+import collections
+import functools
 import json
 import logging
 import os
-from typing import Optional
+import secrets
+import shutil
+from pathlib import Path
+from typing import Callable, Literal, Optional, Union
 
 from pyProfileMgr.profile_data import ProfileData, ProfileType
 from pyProfileMgr.ret import Ret
 
+try:
+    import orjson  # Optional, speeds up reading and writing the profile data.
+except ImportError:
+    orjson = None  # pylint: disable=invalid-name
+
 ################################################################################
 # Variables
 ################################################################################
 
 LOG: logging.Logger = logging.getLogger(__name__)
 
-PATH_TO_PROFILES_FOLDER = "/.pyProfileMgr/.profiles/"
+PATH_TO_PROFILES_FOLDER = os.path.join(".pyProfileMgr", ".profiles")
 CERT_FILE = ".cert.crt"
 DATA_FILE = ".data.json"
+# The files a profile folder may contain.
+_KNOWN_PROFILE_FILES = frozenset((DATA_FILE, CERT_FILE))
 
 TYPE_KEY = 'type'
 SERVER_URL_KEY = 'server'
@@ -60,30 +71,146 @@ TOKEN_KEY = 'token'
 USER_KEY = 'user'
 PASSWORD_KEY = 'password'
 
+# The decisions of the fixed policies for adding a profile that already exists.
+_CONFLICT_POLICIES = {"overwrite": True, "skip": False}
+
+# The maximum number of parsed profiles kept by a profile manager.
+_PROFILE_CACHE_SIZE = 32
+
+# Maps the stored profile type values to the profile types.
+_PROFILE_TYPE_MAP = {profile_type.value: profile_type for profile_type in ProfileType}
+
 
 ################################################################################
 # Functions
 ################################################################################
 
+@functools.cache
 def prepare_profiles_folder() -> str:
     """ Prepares the profiles storage folder and returns the path to it.
 
         Profile data is stored under the users home directory.
+        The folder is prepared only once, later calls return the cached path.
 
     Returns:
         str: The path to the profiles folder.
     """
 
-    profiles_storage_path = os.path.expanduser(
-        "~") + PATH_TO_PROFILES_FOLDER
+    profiles_storage_path = os.path.join(Path.home(), PATH_TO_PROFILES_FOLDER)
 
     # Create the profiles storage folder if it does not exist.
-    if not os.path.exists(profiles_storage_path):
-        os.makedirs(profiles_storage_path)
+    os.makedirs(profiles_storage_path, exist_ok=True)
 
     return profiles_storage_path
 
 
+@functools.lru_cache(maxsize=256)
+def _profile_paths(profiles_storage_path: str, profile_name: str) -> tuple[str, str, str]:
+    """ Gets the paths of the profile folder and its data and certificate files.
+
+        The paths are cached, since they are needed by every profile operation.
+
+    Args:
+        profiles_storage_path (str): The path to the profiles storage folder.
+        profile_name (str): The name of the profile.
+
+    Returns:
+        tuple[str, str, str]: The paths to the profile folder, data file and certificate file.
+    """
+    profile_path = os.path.join(profiles_storage_path, profile_name)
+
+    return profile_path, os.path.join(profile_path, DATA_FILE), os.path.join(profile_path, CERT_FILE)
+
+
+def _remove_file(file_path: str) -> None:
+    """ Removes a file. A file that does not exist is ignored.
+
+    Args:
+        file_path (str): The path to the file to remove.
+    """
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+
+
+def _write_file_atomic(file_path: str, data: bytes) -> None:
+    """ Writes the data to a file atomically.
+
+        The data is written to a temporary file in the same folder, which then
+        replaces the file. If writing fails, the previous file is left untouched.
+        The mode of an existing file is kept, a new file gets the mode given by the umask.
+
+    Args:
+        file_path (str): The path to the file to write.
+        data (bytes): The data to write.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    tmp_file_path = f"{file_path}.{secrets.token_hex(8)}.tmp"
+
+    # Unlike tempfile.mkstemp(), which restricts the mode to the owner, let the umask apply.
+    file_descriptor = os.open(tmp_file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(file_descriptor, 'wb') as tmp_file:
+            tmp_file.write(data)
+
+        try:
+            shutil.copymode(file_path, tmp_file_path)
+        except FileNotFoundError:
+            pass
+
+        os.replace(tmp_file_path, file_path)
+
+    except BaseException:
+        _remove_file(tmp_file_path)
+        raise
+
+
+def _serialize_profile(write_dict: dict) -> bytes:
+    """ Serializes the profile data to compact UTF-8 encoded JSON.
+
+        orjson is used if it is installed. The stdlib json module is configured
+        to produce the same output.
+
+    Args:
+        write_dict (dict): The profile data to serialize.
+
+    Returns:
+        bytes: The JSON document.
+
+    Raises:
+        ValueError: If the profile data cannot be encoded as UTF-8, e.g. a surrogate
+            escaped command line argument which is not valid UTF-8.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(write_dict)
+        except TypeError as exc:
+            # orjson reports strings, which are not valid UTF-8, as type error.
+            raise ValueError(str(exc)) from exc
+
+    return json.dumps(write_dict, separators=(",", ":"), ensure_ascii=False).encode("UTF-8")
+
+
+def _deserialize_profile(data: bytes) -> dict:
+    """ Deserializes the profile data from UTF-8 encoded JSON.
+
+        orjson is used if it is installed.
+
+    Args:
+        data (bytes): The JSON document.
+
+    Returns:
+        dict: The profile data.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
 ################################################################################
 # Classes
 ################################################################################
@@ -93,26 +220,43 @@ class ProfileMgr:
         This includes adding, deleting or configuring profile data.
     """
 
-    profiles_storage_path = prepare_profiles_folder()
+    __slots__ = ("_loaded_profile_data", "_loaded_profile_dict", "_profile_cache")
 
     def __init__(self):
         self._loaded_profile_data = None
+        self._loaded_profile_dict = None
+        # Profiles parsed by load(): profile name -> (file state, profile data, profile dict)
+        self._profile_cache: collections.OrderedDict[str, tuple[tuple[int, int, int, int, bool], ProfileData, dict]] = \
+            collections.OrderedDict()
 
-    # pylint: disable=R0912, R0913, R0917
+    # pylint: disable=R0912, R0913, R0914, R0917
 
     @property
     def loaded_profile(self) -> Optional[ProfileData]:
-        """ Gets a copy of the loaded profile data.
+        """ Gets the loaded profile data.
+
+            No copy is needed, since the profile data is immutable.
 
         Returns:
             ProfileData: The data of the loaded profile.
         """
-        return copy.copy(self._loaded_profile_data)
+        return self._loaded_profile_data
 
     @property
     def profiles_folder(self) -> str:
-        """ Gets the path to the profiles storage folder. """
-        return self.profiles_storage_path
+        """ Gets the path to the profiles storage folder.
+
+            The folder is prepared on first use and not already on import.
+        """
+        return prepare_profiles_folder()
+
+    @property
+    def profiles_storage_path(self) -> str:
+        """ Gets the path to the profiles storage folder.
+
+            Kept for compatibility, use profiles_folder instead.
+        """
+        return self.profiles_folder
 
     def add(self,
             profile_name: str,
@@ -121,7 +265,8 @@ class ProfileMgr:
             token: Optional[str],
             user: Optional[str],
             password: Optional[str],
-            cert_path: Optional[str]) -> Ret.CODE:
+            cert_path: Optional[str],
+            on_conflict: Union[Literal["overwrite", "skip", "ask"], Callable[[str], bool]] = "ask") -> Ret.CODE:
         """ Adds a new profile with the provided details.
 
         NOTE: This function automatically loads the profile ('profile_name') on success.
@@ -134,11 +279,21 @@ class ProfileMgr:
             user (str): The user for authentication at the server.
             password (str): The password for authentication at the server.
             cert_path (str): The file path to the profile's server certificate.
+            on_conflict (str | Callable[[str], bool]): Decides whether an existing profile with the
+                same name is overridden: 'overwrite' always overrides it, 'skip' keeps it and 'ask'
+                (default) asks the user interactively. A callable gets the profile name and returns
+                True to override.
 
         Returns:
             Ret.CODE: A status code indicating the result of the operation.
+
+        Raises:
+            ValueError: If 'on_conflict' is neither a callable nor a known policy.
         """
 
+        if not callable(on_conflict) and on_conflict != "ask" and on_conflict not in _CONFLICT_POLICIES:
+            raise ValueError(f"Unknown conflict policy '{on_conflict}'")
+
         ret_status = Ret.CODE.RET_OK
         add_profile = True
 
@@ -158,21 +313,24 @@ class ProfileMgr:
             else:
                 return Ret.CODE.RET_ERROR_MISSING_CREDENTIALS
 
-        profile_path = self.profiles_storage_path + f"{profile_name}/"
+        profile_path, data_file_path, cert_file_path = _profile_paths(self.profiles_folder, profile_name)
+        self._profile_cache.pop(profile_name, None)
 
-        if not os.path.exists(profile_path):
+        try:
             os.mkdir(profile_path)
-        else:
-            print(
-                "A profile with this name already exists. Do you want to override this profile?")
-            response = input("(y/n): ")
-
-            if response == 'y':
-                if os.path.exists(profile_path + DATA_FILE):
-                    os.remove(profile_path + DATA_FILE)
+            created = True
+        except FileExistsError:
+            created = False
+            if callable(on_conflict):
+                override = on_conflict(profile_name)
+            elif on_conflict == "ask":
+                override = self._prompt_override(profile_name)
+            else:
+                override = _CONFLICT_POLICIES[on_conflict]
 
-                if os.path.exists(profile_path + CERT_FILE):
-                    os.remove(profile_path + CERT_FILE)
+            if override:
+                # The data file is replaced on writing, only a stale certificate must be removed.
+                _remove_file(cert_file_path)
             else:
                 add_profile = False
 
@@ -184,6 +342,9 @@ class ProfileMgr:
                 msg = f"Successfully created profile '{profile_name}'."
                 LOG.info(msg)
                 print(msg)
+            elif created and not os.path.exists(data_file_path):
+                # An empty profile folder would block adding the profile again.
+                shutil.rmtree(profile_path, ignore_errors=True)
 
         else:
             LOG.info("Adding profile '%s' has been canceled.", profile_name)
@@ -208,24 +369,29 @@ class ProfileMgr:
         """
         ret_status = Ret.CODE.RET_OK
 
-        profile_path = self.profiles_storage_path + f"{profile_name}/"
-        if not os.path.exists(profile_path):
-            return Ret.CODE.RET_ERROR_PROFILE_NOT_FOUND
+        _, _, cert_file_path = _profile_paths(self.profiles_folder, profile_name)
+        self._profile_cache.pop(profile_name, None)
 
         try:
-            with self._open_file(cert_path, 'r') as cert_file_src:
-                cert_data = cert_file_src.read()
+            # The certificate is copied as is, the copy is done by the OS where possible.
+            shutil.copyfile(cert_path, cert_file_path)
 
-                with self._open_file(profile_path + CERT_FILE, 'w') as cert_file_profile:
-                    cert_file_profile.write(cert_data)
-                    if self._loaded_profile_data and self._loaded_profile_data.profile_name == profile_name:
-                        self._loaded_profile_data.cert_path = cert_file_profile.name
+            if self._loaded_profile_data and self._loaded_profile_data.profile_name == profile_name:
+                self._loaded_profile_data = self._loaded_profile_data._replace(
+                    cert_path=cert_file_path)
 
-                    msg = f"Successfully added certificate to profile '{profile_name}'."
-                    LOG.info(msg)
-                    print(msg)
+            msg = f"Successfully added certificate to profile '{profile_name}'."
+            LOG.info(msg)
+            print(msg)
+
+        except FileNotFoundError as exc:
+            # The certificate can only be missing in the profile, if the profile folder is missing.
+            if exc.filename == cert_file_path:
+                ret_status = Ret.CODE.RET_ERROR_PROFILE_NOT_FOUND
+            else:
+                ret_status = Ret.CODE.RET_ERROR_FILEPATH_INVALID
 
-        except IOError:
+        except OSError:
             ret_status = Ret.CODE.RET_ERROR_FILEPATH_INVALID
 
         return ret_status
@@ -248,28 +414,38 @@ class ProfileMgr:
         if ret_status != Ret.CODE.RET_OK:
             return ret_status
 
-        write_dict = {
-            TYPE_KEY: self._loaded_profile_data.profile_type if self._loaded_profile_data else None,
-            SERVER_URL_KEY: self._loaded_profile_data.server_url if self._loaded_profile_data else None,
-            TOKEN_KEY: api_token
-        }
+        # Reuse the profile data parsed by load(). The token replaces the user/password authentication.
+        write_dict = dict(self._loaded_profile_dict)
+        write_dict[TOKEN_KEY] = api_token
+        write_dict.pop(USER_KEY, None)
+        write_dict.pop(PASSWORD_KEY, None)
 
-        profile_path = self.profiles_storage_path + f"{profile_name}/"
+        _, data_file_path, _ = _profile_paths(self.profiles_folder, profile_name)
+        self._profile_cache.pop(profile_name, None)
+
+        # A read-only data file protects the profile against changes.
+        if not os.access(data_file_path, os.W_OK):
+            return Ret.CODE.RET_ERROR_FILE_OPEN_FAILED
 
         try:
-            with self._open_file(profile_path + DATA_FILE, 'w') as data_file:
-                profile_data = json.dumps(write_dict, indent=4)
-                data_file.write(profile_data)
-                if self._loaded_profile_data and self._loaded_profile_data.profile_name == profile_name:
-                    self._loaded_profile_data.token = api_token
+            _write_file_atomic(data_file_path, _serialize_profile(write_dict))
 
-                msg = f"Successfully added an API token to profile '{profile_name}'."
-                LOG.info(msg)
-                print(msg)
+            self._loaded_profile_dict = write_dict
+            if self._loaded_profile_data and self._loaded_profile_data.profile_name == profile_name:
+                self._loaded_profile_data = self._loaded_profile_data._replace(
+                    token=api_token, user=None, password=None)
+
+            msg = f"Successfully added an API token to profile '{profile_name}'."
+            LOG.info(msg)
+            print(msg)
 
-        except IOError:
+        except OSError:
             ret_status = Ret.CODE.RET_ERROR_FILE_OPEN_FAILED
 
+        except ValueError:
+            LOG.error("The token for profile '%s' cannot be stored as UTF-8", profile_name)
+            ret_status = Ret.CODE.RET_ERROR
+
         return ret_status
 
     def delete(self, profile_name: str) -> None:
@@ -280,26 +456,31 @@ class ProfileMgr:
         Args:
             profile_name (str): _description_
         """
-        profile_path = self.profiles_storage_path + f"{profile_name}/"
+        profile_path, _, _ = _profile_paths(self.profiles_folder, profile_name)
 
-        if os.path.exists(profile_path):
-            if os.path.exists(profile_path + DATA_FILE):
-                os.remove(profile_path + DATA_FILE)
+        # The profile folder must be a direct child of the profiles folder. Otherwise names
+        # like '', '.' or '..' would remove the profiles folder or even its parent.
+        if os.path.dirname(os.path.normpath(profile_path)) != os.path.normpath(self.profiles_folder):
+            LOG.error("Invalid profile name '%s'", profile_name)
+            return
 
-            if os.path.exists(profile_path + CERT_FILE):
-                os.remove(profile_path + CERT_FILE)
+        self._profile_cache.pop(profile_name, None)
 
-            os.rmdir(profile_path)
+        try:
+            shutil.rmtree(profile_path)
 
-            if self._loaded_profile_data and self._loaded_profile_data.profile_name == profile_name:
-                self._reset()
+        except FileNotFoundError:
+            LOG.error("Folder for profile '%s' does not exist", profile_name)
 
+        else:
             msg = f"Successfully removed profile '{profile_name}'."
             LOG.info(msg)
             print(msg)
 
-        else:
-            LOG.error("Folder for profile '%s' does not exist", profile_name)
+        finally:
+            # Do not keep the profile loaded, even if it was removed only partially.
+            if self._loaded_profile_data and self._loaded_profile_data.profile_name == profile_name:
+                self._reset()
 
     def get_profiles(self) -> list[str]:
         """ Gets a list of all stored profiles.
@@ -308,14 +489,33 @@ class ProfileMgr:
             [str]: List of all stored profiles.
         """
 
-        profile_names = []
-
-        for file_name in os.listdir(self.profiles_storage_path):
-            if os.path.isfile(os.path.join(self.profiles_storage_path, file_name)) is False:
-                profile_names.append(file_name)
+        # The entry type is provided by the directory listing itself,
+        # so no additional stat() call per entry is needed.
+        with os.scandir(self.profiles_folder) as entries:
+            profile_names = [entry.name for entry in entries if entry.is_dir()]
 
         return profile_names
 
+    def get_all_profiles(self) -> dict[str, ProfileData]:
+        """ Gets the data of all stored profiles.
+
+            Profiles that cannot be loaded are skipped.
+            The loaded profile is not changed.
+
+        Returns:
+            dict[str, ProfileData]: The profile data by profile name.
+        """
+        all_profiles = {}
+
+        for profile_name in self.get_profiles():
+            ret_status, profile_data, _ = self._read_profile(profile_name)
+            if ret_status == Ret.CODE.RET_OK:
+                all_profiles[profile_name] = profile_data
+            else:
+                LOG.warning("Skipping profile '%s': %s", profile_name, Ret.MSG[ret_status])
+
+        return all_profiles
+
     def load(self, profile_name: str) -> Ret.CODE:
         """ Loads the profile with the specified name.
 
@@ -327,48 +527,110 @@ class ProfileMgr:
         """
         self._reset()
 
-        ret_status = Ret.CODE.RET_OK
+        ret_status, profile_data, profile_dict = self._read_profile(profile_name)
+        if ret_status == Ret.CODE.RET_OK:
+            self._loaded_profile_data = profile_data
+            self._loaded_profile_dict = profile_dict
 
-        profile_path = self.profiles_storage_path + f"{profile_name}/"
+        return ret_status
+
+    def _read_profile(self, profile_name: str) -> tuple[Ret.CODE, Optional[ProfileData], Optional[dict]]:
+        """ Reads the profile with the specified name from its folder.
+
+            A profile is parsed again only if its files have changed since it was last read.
+
+        Args:
+            profile_name (str): The name of the server profile to read.
+
+        Returns:
+            tuple[Ret.CODE, Optional[ProfileData], Optional[dict]]: The status code, the profile data
+                and the stored profile dictionary. The data is None if reading failed.
+        """
+        profile_path, data_file_path, cert_file_path = _profile_paths(self.profiles_folder, profile_name)
 
         try:
-            with self._open_file(profile_path + DATA_FILE, 'r') as data_file:
-                profile_dict = json.load(data_file)
-
-                profile_type = None
-                try:
-                    # TRICKY: Do not use 'contains' since that has several issues
-                    # with StrEnum, which differ in multiple Python versions.
-                    # pylint: disable=E1121
-                    profile_type = ProfileType(profile_dict[TYPE_KEY])
-                except ValueError:
-                    return Ret.CODE.RET_ERROR_INVALID_PROFILE_TYPE
-
-                token = None
-                if TOKEN_KEY in profile_dict:
-                    token = profile_dict[TOKEN_KEY]
-
-                username = None
-                password = None
-                if USER_KEY in profile_dict and PASSWORD_KEY in profile_dict:
-                    username = profile_dict[USER_KEY]
-                    password = profile_dict[PASSWORD_KEY]
-
-                cert_path = None
-                if os.path.exists(profile_path + CERT_FILE):
-                    cert_path = profile_path + CERT_FILE
-
-                self._loaded_profile_data = ProfileData(
-                    profile_name, profile_type, profile_dict[SERVER_URL_KEY], token, username, password, cert_path)
-
-        except IOError:
-            ret_status = Ret.CODE.RET_ERROR_PROFILE_NOT_FOUND
+            # A single listing of the profile folder tells which profile files exist.
+            with os.scandir(profile_path) as entries:
+                profile_files = {entry.name: entry for entry in entries if entry.name in _KNOWN_PROFILE_FILES}
 
-        return ret_status
+            if DATA_FILE not in profile_files:
+                return Ret.CODE.RET_ERROR_PROFILE_NOT_FOUND, None, None
+
+            # Every write replaces the data file, so its inode changes even if the modification time
+            # does not, e.g. on file systems with coarse timestamps. DirEntry.stat() lacks the inode
+            # on Windows.
+            data_file_stat = os.stat(profile_files[DATA_FILE].path)
+            file_state = (data_file_stat.st_dev, data_file_stat.st_ino, data_file_stat.st_mtime_ns,
+                          data_file_stat.st_size, CERT_FILE in profile_files)
+
+            cached_profile = self._profile_cache.get(profile_name)
+            if cached_profile is not None and cached_profile[0] == file_state:
+                self._profile_cache.move_to_end(profile_name)
+                return Ret.CODE.RET_OK, cached_profile[1], cached_profile[2]
+
+            with open(data_file_path, 'rb') as data_file:
+                profile_dict = _deserialize_profile(data_file.read())
+
+            # TRICKY: Do not use 'contains' on ProfileType since that has several
+            # issues with StrEnum, which differ in multiple Python versions.
+            profile_type = _PROFILE_TYPE_MAP.get(profile_dict[TYPE_KEY])
+            server_url = profile_dict[SERVER_URL_KEY]
+
+        except OSError:
+            return Ret.CODE.RET_ERROR_PROFILE_NOT_FOUND, None, None
+
+        except (ValueError, KeyError, TypeError):
+            # The data file is corrupt or lacks the profile type or server URL.
+            LOG.error("Data file of profile '%s' is invalid", profile_name)
+            return Ret.CODE.RET_ERROR_FILE_OPEN_FAILED, None, None
+
+        if profile_type is None:
+            return Ret.CODE.RET_ERROR_INVALID_PROFILE_TYPE, None, None
+
+        token = profile_dict.get(TOKEN_KEY)
+
+        # User and password are only used as a pair.
+        username = profile_dict.get(USER_KEY)
+        password = profile_dict.get(PASSWORD_KEY)
+        if username is None or password is None:
+            username = None
+            password = None
+
+        cert_path = None
+        if CERT_FILE in profile_files:
+            cert_path = cert_file_path
+
+        profile_data = ProfileData(
+            profile_name, profile_type, server_url, token, username, password, cert_path)
+
+        self._profile_cache[profile_name] = (file_state, profile_data, profile_dict)
+        self._profile_cache.move_to_end(profile_name)
+        if len(self._profile_cache) > _PROFILE_CACHE_SIZE:
+            # Drop the least recently read profile.
+            self._profile_cache.popitem(last=False)
+
+        return Ret.CODE.RET_OK, profile_data, profile_dict
+
+    @staticmethod
+    def _prompt_override(profile_name: str) -> bool:
+        """ Asks the user whether an existing profile shall be overridden.
+
+        Args:
+            profile_name (str): The name of the existing profile.
+
+        Returns:
+            bool: True if the profile shall be overridden, otherwise False.
+        """
+        print(
+            f"A profile with the name '{profile_name}' already exists. Do you want to override this profile?")
+        response = input("(y/n): ")
+
+        return response == 'y'
 
     def _reset(self):
         """ Initializes instance attributes. """
         self._loaded_profile_data = None
+        self._loaded_profile_dict = None
 
     def _add_new_profile(self, write_dict: dict, profile_name: str, cert_path: Optional[str]) -> Ret.CODE:
         """ Adds a new server profile to the configuration.
@@ -384,44 +646,19 @@ class ProfileMgr:
 
         ret_status = Ret.CODE.RET_OK
 
-        profile_path = self.profiles_storage_path + f"{profile_name}/"
-        profile_data = json.dumps(write_dict, indent=4)
+        _, data_file_path, _ = _profile_paths(self.profiles_folder, profile_name)
 
         try:
-            with self._open_file(profile_path + DATA_FILE, 'w') as data_file:
-                data_file.write(profile_data)
+            _write_file_atomic(data_file_path, _serialize_profile(write_dict))
 
-        except IOError:
-            ret_status = Ret.CODE.RET_ERROR_FILEPATH_INVALID
+        except OSError:
+            return Ret.CODE.RET_ERROR_FILEPATH_INVALID
+
+        except ValueError:
+            LOG.error("The data of profile '%s' cannot be stored as UTF-8", profile_name)
+            return Ret.CODE.RET_ERROR
 
         if cert_path:
             ret_status = self.add_certificate(profile_name, cert_path)
 
         return ret_status
-
-    # pylint: disable=R1732
-    def _open_file(self, file_path: str, mode: str):
-        """ Opens a file (encoding="UTF-8") in the given mode.
-
-        Args:
-            file_path (str): The path to the file to open.
-            mode (str): The mode to open the file in.
-
-        Returns:
-            file: The opened file.
-
-        Raises:
-            IOError: If the file does not exist.
-            IOError: If the file cannot be accessed.
-            IOError: If the file cannot be opened.
-        """
-        try:
-            file = open(file_path, mode, encoding="UTF-8")
-            return file
-
-        except FileNotFoundError as exc:
-            raise IOError(f"File '{file_path}' not found.") from exc
-        except PermissionError as exc:
-            raise IOError(f"Permission denied for '{file_path}'.") from exc
-        except Exception as exc:
-            raise IOError(f"Error opening file '{file_path}': {exc}") from exc
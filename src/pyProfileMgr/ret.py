@@ -32,7 +32,6 @@
 # Imports
 ################################################################################
 
-from dataclasses import dataclass
 from enum import IntEnum
 
 ################################################################################
@@ -45,8 +44,7 @@ from enum import IntEnum
 ################################################################################
 
 
-@dataclass
-class Ret():
+class Ret():  # pylint: disable=R0903
     """ The return values of pyProfileMgr. """
 
     class CODE(IntEnum):
@@ -62,6 +60,7 @@ class Ret():
         RET_ERROR_INVALID_PROFILE_TYPE = 8
         RET_ERROR_PROFILE_NOT_FOUND = 9
         RET_ERROR_PROFILE_ALREADY_EXISTS = 10
+        RET_ERROR_NO_UPDATE_FIELDS = 11
 
     MSG = {
         CODE.RET_OK:                                "Process successful.",
@@ -78,6 +77,8 @@ class Ret():
         CODE.RET_ERROR_PROFILE_NOT_FOUND:           "The profile does not exist.",
         CODE.RET_ERROR_PROFILE_ALREADY_EXISTS:      "The profile you want to add already exists.\n" +
                                                     "Use the 'update' command to update it.",
+        CODE.RET_ERROR_NO_UPDATE_FIELDS:            "No supported field to update was provided.\n" +
+                                                    "Currently only the certificate (--cert) can be updated.",
     }
 
 
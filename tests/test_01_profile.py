@@ -33,13 +33,18 @@
 # Imports
 ################################################################################
 
+import contextlib
 import json
 import os
+import shutil
 import stat
+from pathlib import Path
+from typing import Optional
 
 import pytest
 
-from pyProfileMgr.profile_data import ProfileType
+from pyProfileMgr import profile_mgr as profile_mgr_module
+from pyProfileMgr.profile_data import ProfileData, ProfileType
 from pyProfileMgr.profile_mgr import ProfileMgr, DATA_FILE
 from pyProfileMgr.ret import Ret
 
@@ -53,8 +58,20 @@ TEST_SERVER = 'testServer'
 TEST_TOKEN = 'testToken'
 TEST_USER = 'testUser'
 TEST_PASSWORD = 'testPassword'
-TEST_CERT_PATH = TEST_CERT_PATH = os.path.dirname(os.path.realpath(__file__)) + \
-    "/test_data/testCertificate.cert"
+INVALID_UTF8 = b'\xff'.decode('UTF-8', 'surrogateescape')
+_TEST_DATA_DIR = Path(__file__).resolve().parent / "test_data"
+TEST_CERT_PATH = os.fspath(_TEST_DATA_DIR / "testCertificate.cert")
+TEST_MISSING_CERT_PATH = os.fspath(_TEST_DATA_DIR / "doesnotexist.cert")
+
+# Frequently checked return codes.
+_OK = Ret.CODE.RET_OK
+_NOT_FOUND = Ret.CODE.RET_ERROR_PROFILE_NOT_FOUND
+_BAD_PATH = Ret.CODE.RET_ERROR_FILEPATH_INVALID
+
+# Test profile configurations, as keyword arguments of _add().
+TOKEN_PROFILE = {"profile_type": ProfileType.JIRA, "token": TEST_TOKEN}
+USER_PASSWORD_PROFILE = {"profile_type": ProfileType.SUPERSET, "token": None}
+CERT_PROFILE = {"profile_type": ProfileType.POLARION, "cert_file": TEST_CERT_PATH}
 
 
 ################################################################################
@@ -66,110 +83,225 @@ TEST_CERT_PATH = TEST_CERT_PATH = os.path.dirname(os.path.realpath(__file__)) +
 ################################################################################
 
 
+def _fail_writing(file_path: str, _data: bytes) -> None:
+    ''' Replaces the writing of a file, which always fails. '''
+
+    raise PermissionError(file_path)
+
+
 # pylint: disable=W0621
+def _add(profile_mgr: ProfileMgr,  # pylint: disable=R0913
+         profile_type: ProfileType = ProfileType.JIRA,
+         *,
+         token: Optional[str] = TEST_TOKEN,
+         user: Optional[str] = TEST_USER,
+         password: Optional[str] = TEST_PASSWORD,
+         cert_file: Optional[str] = None,
+         on_conflict="ask") -> Ret.CODE:
+    ''' Adds the test profile on the test server, with the test credentials unless given otherwise. '''
+
+    return profile_mgr.add(TEST_PROFILE_NAME, profile_type, TEST_SERVER,
+                           token, user, password, cert_file, on_conflict=on_conflict)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def profiles_folder(tmp_path_factory):
+    ''' Stores the profiles of all tests of the session in a temporary folder instead of the users home directory. '''
+
+    folder = str(tmp_path_factory.mktemp("profiles"))
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(profile_mgr_module, "prepare_profiles_folder", lambda: folder)
+
+        yield folder
+
+
+@pytest.fixture
+def profile_mgr() -> ProfileMgr:
+    ''' Provides a new ProfileManager per test, so no loaded or parsed profile is carried over between tests.
+
+        Creating it does not touch the file system.
+    '''
+    return ProfileMgr()
+
+
+@pytest.fixture(scope="session")
+def cert_path() -> str:
+    ''' Provides the path to the test certificate, which is checked once per session. '''
+
+    assert Path(TEST_CERT_PATH).is_file()
+    return TEST_CERT_PATH
+
+
+@pytest.fixture(scope="module")
+def cert_profile_data() -> ProfileData:
+    ''' Adds the test profile in the CERT_PROFILE configuration once per module and provides its loaded data.
+
+        The data is immutable, so it stays valid when the test profile is removed by later tests.
+    '''
+    profile_mgr = ProfileMgr()
+    assert _add(profile_mgr, **CERT_PROFILE, on_conflict="overwrite") == _OK
+    assert profile_mgr.loaded_profile
+
+    return profile_mgr.loaded_profile
+
+
 @pytest.fixture(autouse=True)
-def profile_mgr():
-    ''' Manages setup and teardown of the ProfileManager. '''
+def clean_test_profile(profiles_folder: str):
+    ''' Deletes the test profile from previous tests (if it exists). '''
+
+    shutil.rmtree(os.path.join(profiles_folder, TEST_PROFILE_NAME), ignore_errors=True)
 
-    # Setup: Create profile manager and delete the test profile from previous runs
-    # (if it exists).
-    profile_manager = ProfileMgr()
-    profile_manager.delete(TEST_PROFILE_NAME)
-    assert profile_manager.load(
-        TEST_PROFILE_NAME) is Ret.CODE.RET_ERROR_PROFILE_NOT_FOUND
 
-    yield profile_manager
+@pytest.fixture
+def added_profile(profile_mgr: ProfileMgr, request):
+    ''' Adds the test profile in the configuration given by the test parameter (default: TOKEN_PROFILE). '''
 
-    # Teardown code goes here.
+    assert _add(profile_mgr, **getattr(request, "param", TOKEN_PROFILE)) == _OK
 
 
-def test_add_profile(profile_mgr: ProfileMgr, monkeypatch):
+def test_add_profile(profile_mgr: ProfileMgr, cert_path: str, monkeypatch):
     """Tests the creation of a new profile."""
 
     # TC: Fail to add a profile without credentials (neither token, nor user/password).
-    assert profile_mgr.add(TEST_PROFILE_NAME, ProfileType.JIRA, TEST_SERVER,
-                           None, None, None, None) is Ret.CODE.RET_ERROR_MISSING_CREDENTIALS
+    assert _add(profile_mgr, token=None, user=None, password=None) == Ret.CODE.RET_ERROR_MISSING_CREDENTIALS
+
+    # TC: Fail to add a profile with data which is not valid UTF-8, as given by a surrogate escaped argument.
+    assert _add(profile_mgr, token=INVALID_UTF8) == Ret.CODE.RET_ERROR
+    assert not os.path.exists(os.path.join(profile_mgr.profiles_folder, TEST_PROFILE_NAME))
 
     # TC: All OK - add a new profile and check if it was created successfully.
-    assert profile_mgr.add(TEST_PROFILE_NAME, ProfileType.JIRA, TEST_SERVER,
-                           TEST_TOKEN, TEST_USER, TEST_PASSWORD, TEST_CERT_PATH) is Ret.CODE.RET_OK
+    assert _add(profile_mgr, cert_file=cert_path) == _OK
+
+    # The user answers the override prompts in this order.
+    answers = iter(["y", "n"])
+    monkeypatch.setattr('builtins.input', lambda _: next(answers))
 
     # TC: All OK - overwrite existing profile.
-    monkeypatch.setattr('builtins.input', lambda _: "y")
-    assert profile_mgr.add(TEST_PROFILE_NAME, ProfileType.POLARION, TEST_SERVER,
-                           TEST_TOKEN, TEST_USER, TEST_PASSWORD, TEST_CERT_PATH) is Ret.CODE.RET_OK
+    assert _add(profile_mgr, ProfileType.POLARION, cert_file=cert_path) == _OK
     assert profile_mgr.loaded_profile and profile_mgr.loaded_profile.profile_type == ProfileType.POLARION
 
     # TC: All OK - do not overwrite existing profile (type remains 'polarion').
-    monkeypatch.setattr('builtins.input', lambda _: "n")
-    assert profile_mgr.add(TEST_PROFILE_NAME, ProfileType.SUPERSET, TEST_SERVER,
-                           TEST_TOKEN, TEST_USER, TEST_PASSWORD, None) is Ret.CODE.RET_OK
+    assert _add(profile_mgr, ProfileType.SUPERSET) == _OK
     assert profile_mgr.loaded_profile and profile_mgr.loaded_profile.profile_type == ProfileType.POLARION
 
+    # TC: All OK - the conflict callback decides instead of the user.
+    assert _add(profile_mgr, ProfileType.SUPERSET, on_conflict=lambda _: True) == _OK
+    assert profile_mgr.loaded_profile and profile_mgr.loaded_profile.profile_type == ProfileType.SUPERSET
 
-def test_add_certificate(profile_mgr: ProfileMgr):
-    """Tests the extension of an existing profile with a certificate."""
+    # TC: All OK - the 'skip' policy keeps the existing profile without asking the user.
+    assert _add(profile_mgr, on_conflict="skip") == _OK
+    assert profile_mgr.loaded_profile and profile_mgr.loaded_profile.profile_type == ProfileType.SUPERSET
+
+    # TC: All OK - the 'overwrite' policy overrides the existing profile without asking the user.
+    assert _add(profile_mgr, on_conflict="overwrite") == _OK
+    assert profile_mgr.loaded_profile and profile_mgr.loaded_profile.profile_type == ProfileType.JIRA
+
+    # TC: Fail on an unknown policy instead of asking the user.
+    with pytest.raises(ValueError):
+        _add(profile_mgr, ProfileType.SUPERSET, on_conflict="bogus")
+    assert profile_mgr.load(TEST_PROFILE_NAME) == _OK
+    assert profile_mgr.loaded_profile and profile_mgr.loaded_profile.profile_type == ProfileType.JIRA
+
+    # TC: All OK - a confirmed override replaces a read-only data file.
+    with readonly(os.path.join(profile_mgr.profiles_folder, TEST_PROFILE_NAME, DATA_FILE)):
+        assert _add(profile_mgr, ProfileType.POLARION, on_conflict="overwrite") == _OK
+    assert profile_mgr.loaded_profile and profile_mgr.loaded_profile.profile_type == ProfileType.POLARION
+
+    # TC: Fail to override the profile if its data file cannot be written, the certificate is not added then.
+    with monkeypatch.context() as write_patch:
+        write_patch.setattr(profile_mgr_module, "_write_file_atomic", _fail_writing)
+        assert _add(profile_mgr, cert_file=cert_path, on_conflict="overwrite") == _BAD_PATH
+    assert profile_mgr.load(TEST_PROFILE_NAME) == _OK
+    assert profile_mgr.loaded_profile.profile_type == ProfileType.POLARION
+    assert profile_mgr.loaded_profile.cert_path is None
+
+
+def test_missing_profile(profile_mgr: ProfileMgr, cert_path: str):
+    """Tests that a non-existing profile can neither be loaded nor extended."""
+
+    # TC: Fail to load a non-existing profile.
+    assert profile_mgr.load(
+        TEST_PROFILE_NAME) == _NOT_FOUND
 
     # TC: Fail to add a certificate to a non-existing profile.
     assert profile_mgr.add_certificate(
-        TEST_PROFILE_NAME, TEST_CERT_PATH) is Ret.CODE.RET_ERROR_PROFILE_NOT_FOUND
+        TEST_PROFILE_NAME, cert_path) == _NOT_FOUND
 
-    # TC: Fail to add a non-existing certificate file to the profile.
+    # TC: Fail to add a token to a non-existing profile.
+    assert profile_mgr.add_token(
+        TEST_PROFILE_NAME, TEST_TOKEN) == _NOT_FOUND
 
-    # Add a new profile (without certificate).
-    assert profile_mgr.add(TEST_PROFILE_NAME, ProfileType.JIRA, TEST_SERVER,
-                           TEST_TOKEN, TEST_USER, TEST_PASSWORD, None) is Ret.CODE.RET_OK
 
-    assert profile_mgr.add_certificate(TEST_PROFILE_NAME, os.path.dirname(os.path.realpath(__file__))
-                                       + "/test_data/doesnotexist.cert") is Ret.CODE.RET_ERROR_FILEPATH_INVALID
+@pytest.mark.usefixtures("added_profile")
+def test_add_certificate(profile_mgr: ProfileMgr, cert_path: str):
+    """Tests the extension of an existing profile with a certificate."""
+
+    # TC: Fail to add a non-existing certificate file to the profile.
+    assert profile_mgr.add_certificate(
+        TEST_PROFILE_NAME, TEST_MISSING_CERT_PATH) == _BAD_PATH
 
     # TC: All OK - add an existing certificate to the profile and check if it was added successfully.
     assert profile_mgr.add_certificate(
-        TEST_PROFILE_NAME, TEST_CERT_PATH) is Ret.CODE.RET_OK
+        TEST_PROFILE_NAME, cert_path) == _OK
     assert profile_mgr.loaded_profile and profile_mgr.loaded_profile.cert_path is not None
 
 
-NO_USER_WRITING = ~stat.S_IWUSR
-NO_GROUP_WRITING = ~stat.S_IWGRP
-NO_OTHER_WRITING = ~stat.S_IWOTH
-NO_WRITING = NO_USER_WRITING & NO_GROUP_WRITING & NO_OTHER_WRITING
+# Removes the write permissions of user, group and others from a file mode.
+READONLY_MASK = ~(stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH) & 0o7777
 
 
-def test_add_token(profile_mgr: ProfileMgr):
-    """Tests the extension of an existing profile with a token."""
+@contextlib.contextmanager
+def readonly(path: str):
+    ''' Makes the file read-only and restores its permissions afterwards, also on failure. '''
 
-    # TC: Fail to add a token to a non-existing profile.
-    assert profile_mgr.add_token(
-        TEST_PROFILE_NAME, TEST_TOKEN) is Ret.CODE.RET_ERROR_PROFILE_NOT_FOUND
+    backup_permissions = stat.S_IMODE(os.lstat(path).st_mode)
+    os.chmod(path, backup_permissions & READONLY_MASK)
+    try:
+        yield
+    finally:
+        os.chmod(path, backup_permissions)
 
-    # Add a new profile (without token).
-    assert profile_mgr.add(TEST_PROFILE_NAME, ProfileType.JIRA, TEST_SERVER,
-                           None, TEST_USER, TEST_PASSWORD, None) is Ret.CODE.RET_OK
+
+@pytest.mark.usefixtures("added_profile")
+@pytest.mark.parametrize("added_profile", [USER_PASSWORD_PROFILE], indirect=True)
+def test_add_token(profile_mgr: ProfileMgr):
+    """Tests the extension of an existing profile (without token) with a token."""
+
+    data_file_path = os.path.join(profile_mgr.profiles_folder, TEST_PROFILE_NAME, DATA_FILE)
+    file_mode = stat.S_IMODE(os.stat(data_file_path).st_mode)
 
     # TC: All OK - Add a token to the profile and check if it was added successfully.
 
     assert profile_mgr.add_token(
-        TEST_PROFILE_NAME, TEST_TOKEN) is Ret.CODE.RET_OK
+        TEST_PROFILE_NAME, TEST_TOKEN) == _OK
     assert profile_mgr.loaded_profile and profile_mgr.loaded_profile.token == TEST_TOKEN
 
+    # The data file keeps its mode when it is replaced.
+    assert stat.S_IMODE(os.stat(data_file_path).st_mode) == file_mode
+
+    # The token replaces the user/password authentication, also in the stored profile.
+    assert profile_mgr.loaded_profile.user is None and profile_mgr.loaded_profile.password is None
+    assert profile_mgr.load(TEST_PROFILE_NAME) == _OK
+    assert profile_mgr.loaded_profile.user is None and profile_mgr.loaded_profile.token == TEST_TOKEN
+
+    # TC: Fail to add a token which is not valid UTF-8, the stored token is kept.
+    assert profile_mgr.add_token(TEST_PROFILE_NAME, INVALID_UTF8) == Ret.CODE.RET_ERROR
+    assert profile_mgr.load(TEST_PROFILE_NAME) == _OK
+    assert profile_mgr.loaded_profile.token == TEST_TOKEN
+
     # TC: Fail to add token if data file is read-only.
-    data_file_path = profile_mgr.profiles_folder + TEST_PROFILE_NAME + \
-        "/" + DATA_FILE
-    backup_permissions = stat.S_IMODE(os.lstat(data_file_path).st_mode)
-    os.chmod(data_file_path, backup_permissions & NO_WRITING)
-    assert profile_mgr.add_token(
-        TEST_PROFILE_NAME, TEST_TOKEN) is Ret.CODE.RET_ERROR_FILE_OPEN_FAILED
-    # Restore the previous permissions.
-    os.chmod(data_file_path, backup_permissions)
+    with readonly(data_file_path):
+        assert profile_mgr.add_token(
+            TEST_PROFILE_NAME, TEST_TOKEN) == Ret.CODE.RET_ERROR_FILE_OPEN_FAILED
 
 
+@pytest.mark.usefixtures("added_profile")
+@pytest.mark.parametrize("added_profile", [TOKEN_PROFILE, USER_PASSWORD_PROFILE, CERT_PROFILE], indirect=True,
+                         ids=["token", "user_password", "cert"])
 def test_delete_profile(profile_mgr: ProfileMgr):
     """Tests the deletion of a new profile."""
 
-    # Add a new profile.
-    assert profile_mgr.add(TEST_PROFILE_NAME, ProfileType.SUPERSET, TEST_SERVER,
-                           None, TEST_USER, TEST_PASSWORD, None) is Ret.CODE.RET_OK
-
     # TC: Delete a profile and check that it was deleted successfully.
     try:
         profile_mgr.delete(TEST_PROFILE_NAME)
@@ -177,69 +309,126 @@ def test_delete_profile(profile_mgr: ProfileMgr):
     except Exception as exc:
         pytest.fail(f"Unexpected exception: {exc}")
 
+    assert TEST_PROFILE_NAME not in profile_mgr.get_profiles()
+    assert profile_mgr.loaded_profile is None
 
-def test_loaded_profile_attributes(profile_mgr: ProfileMgr):
-    """Tests the getters of the profile manager."""
 
-    # TC: get_profiles
+@pytest.mark.usefixtures("added_profile")
+@pytest.mark.parametrize("profile_name", ["", ".", "..", os.path.join("..", TEST_PROFILE_NAME)])
+def test_delete_invalid_profile_name(profile_mgr: ProfileMgr, profile_name: str):
+    """Tests that deleting a profile with an invalid name does not remove any other data."""
 
-    # Add a new profile including certificate.
-    assert profile_mgr.add(TEST_PROFILE_NAME, ProfileType.POLARION, TEST_SERVER,
-                           TEST_TOKEN, TEST_USER, TEST_PASSWORD, TEST_CERT_PATH) is Ret.CODE.RET_OK
+    # TC: Neither the profiles folder nor other profiles are removed.
+    profile_mgr.delete(profile_name)
 
-    profiles = profile_mgr.get_profiles()
-    assert TEST_PROFILE_NAME in profiles
+    assert os.path.isdir(profile_mgr.profiles_folder)
+    assert TEST_PROFILE_NAME in profile_mgr.get_profiles()
 
-    # TC: get_name
-    assert profile_mgr.loaded_profile and profile_mgr.loaded_profile.profile_name == TEST_PROFILE_NAME
 
-    # TC: get_type
-    assert profile_mgr.loaded_profile and profile_mgr.loaded_profile.profile_type == ProfileType.POLARION
+@pytest.mark.parametrize("attribute, expected", [
+    ("profile_name", TEST_PROFILE_NAME),
+    ("profile_type", ProfileType.POLARION),
+    ("server_url", TEST_SERVER),
+    ("token", TEST_TOKEN),
+    # User and password are expected to be None since the profile contains a token.
+    ("user", None),
+    ("password", None),
+])
+def test_loaded_profile_attribute(cert_profile_data: ProfileData, attribute: str, expected):
+    """Tests a single attribute of the loaded profile."""
 
-    # TC: get_server_url
-    assert profile_mgr.loaded_profile and profile_mgr.loaded_profile.server_url == TEST_SERVER
+    assert getattr(cert_profile_data, attribute) == expected
 
-    # TC: get_api_token
-    assert profile_mgr.loaded_profile and profile_mgr.loaded_profile.token == TEST_TOKEN
 
-    # TC: get_user (expected to be None since the profile contains a token).
-    assert profile_mgr.loaded_profile and profile_mgr.loaded_profile.user is None
+def test_loaded_profile_cert_path(cert_profile_data: ProfileData):
+    """Tests that the loaded profile refers to the certificate in the profile folder."""
 
-    # TC: get_password (expected to be None since the profile contains a token).
-    assert profile_mgr.loaded_profile and profile_mgr.loaded_profile.password is None
+    assert cert_profile_data.cert_path and ".cert" in cert_profile_data.cert_path
 
-    # TC: get_cert_path
-    assert profile_mgr.loaded_profile and profile_mgr.loaded_profile.cert_path and \
-        ".cert" in profile_mgr.loaded_profile.cert_path
+
+@pytest.mark.usefixtures("added_profile")
+@pytest.mark.parametrize("added_profile", [CERT_PROFILE], indirect=True)
+def test_loaded_profile_attributes(profile_mgr: ProfileMgr):
+    """Tests the getters of the profile manager."""
+
+    # TC: get_profiles
+    profiles = profile_mgr.get_profiles()
+    assert TEST_PROFILE_NAME in profiles
+
+    # TC: The former attribute name still provides the profiles folder.
+    assert profile_mgr.profiles_storage_path == profile_mgr.profiles_folder
+
+    # TC: get_all_profiles
+    all_profiles = profile_mgr.get_all_profiles()
+    assert all_profiles[TEST_PROFILE_NAME] == profile_mgr.loaded_profile
 
     # TC: Check that modification of the data is not possible.
-    profile_mgr.loaded_profile.profile_name = "bogus"
+    with pytest.raises(AttributeError):
+        profile_mgr.loaded_profile.profile_name = "bogus"  # type: ignore
     assert profile_mgr.loaded_profile.profile_name == TEST_PROFILE_NAME
 
+    # TC: All OK - loading an unchanged profile again reuses the parsed data.
+    profile_data = profile_mgr.loaded_profile
+    assert profile_mgr.load(TEST_PROFILE_NAME) == _OK
+    assert profile_mgr.loaded_profile is profile_data
+
+    # TC: All OK - a change by another profile manager is noticed, even with the same size and modification time.
+    data_file_path = os.path.join(profile_mgr.profiles_folder, TEST_PROFILE_NAME, DATA_FILE)
+    data_file_stat = os.stat(data_file_path)
+    other_token = TEST_TOKEN[::-1]
+    assert ProfileMgr().add_token(TEST_PROFILE_NAME, other_token) == _OK
+    os.utime(data_file_path, ns=(data_file_stat.st_atime_ns, data_file_stat.st_mtime_ns))
+    assert os.stat(data_file_path).st_size == data_file_stat.st_size
+    assert profile_mgr.load(TEST_PROFILE_NAME) == _OK
+    assert profile_mgr.loaded_profile.token == other_token
 
+
+@pytest.mark.usefixtures("added_profile")
+@pytest.mark.parametrize("added_profile", [USER_PASSWORD_PROFILE], indirect=True)
 def test_invalid_type(profile_mgr: ProfileMgr):
     """Tests that loading a profile with an unknown type fails."""
 
-    # Create a profile and make its type invalid on disk.
+    # Make the type of the profile invalid on disk.
+    data_file_path = os.path.join(profile_mgr.profiles_folder, TEST_PROFILE_NAME, DATA_FILE)
 
-    assert profile_mgr.add(TEST_PROFILE_NAME, ProfileType.SUPERSET, TEST_SERVER,
-                           None, TEST_USER, TEST_PASSWORD, None) is Ret.CODE.RET_OK
+    profile_dict = {
+        'type': 'invalid',
+        'server': TEST_SERVER,
+        'user': TEST_USER,
+        'password': TEST_PASSWORD
+    }
+    with open(data_file_path, 'w', encoding="UTF-8") as data_file:
+        data_file.write(json.dumps(profile_dict, separators=(",", ":")))
 
-    data_file_path = profile_mgr.profiles_folder + TEST_PROFILE_NAME + \
-        "/" + DATA_FILE
+    # TC: Fail to load invalid profile.
+    assert profile_mgr.load(
+        TEST_PROFILE_NAME) == Ret.CODE.RET_ERROR_INVALID_PROFILE_TYPE
 
-    profile_dict = None
-    with open(data_file_path, 'r+', encoding="UTF-8") as data_file:
-        profile_dict = json.load(data_file)
-        profile_dict['type'] = 'invalid'
 
-        data_file.seek(0)
-        data_file.write(json.dumps(profile_dict, indent=4))
-        data_file.truncate()
+@pytest.mark.usefixtures("added_profile")
+@pytest.mark.parametrize("data", [b'{"type":"jira"', b'{"type":"jira"}', b'[]'],
+                         ids=["corrupt", "missing_server", "no_object"])
+def test_broken_profile(profile_mgr: ProfileMgr, data: bytes):
+    """Tests that a profile with a broken data file is skipped."""
 
-    # TC: Fail to load invalid profile.
-    assert profile_mgr.load(
-        TEST_PROFILE_NAME) is Ret.CODE.RET_ERROR_INVALID_PROFILE_TYPE
+    broken_profile_path = os.path.join(profile_mgr.profiles_folder, "broken_profile")
+    os.makedirs(broken_profile_path)
+
+    try:
+        with open(os.path.join(broken_profile_path, DATA_FILE), 'wb') as data_file:
+            data_file.write(data)
+
+        # TC: Fail to load the broken profile.
+        assert profile_mgr.load("broken_profile") == Ret.CODE.RET_ERROR_FILE_OPEN_FAILED
+        assert profile_mgr.loaded_profile is None
+
+        # TC: The broken profile is skipped, the valid one is still provided.
+        all_profiles = profile_mgr.get_all_profiles()
+        assert "broken_profile" not in all_profiles
+        assert TEST_PROFILE_NAME in all_profiles
+
+    finally:
+        shutil.rmtree(broken_profile_path)
 
 
 ################################################################################
@@ -0,0 +1,126 @@
+""" Tests for the command line parser. """
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import sys
+
+import pytest
+
+from pyProfileMgr import __main__ as main_module
+from pyProfileMgr.__main__ import add_parser, main, _sniff_subcommand, _CMD_MODULES
+from pyProfileMgr.version import __version__
+
+
+################################################################################
+# Variables
+################################################################################
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+@pytest.mark.parametrize("argv, expected", [
+    (["-v", "profile", "list"], "profile"),
+    (["--help"], None),
+    (["bogus", "list"], None),
+    ([], None),
+], ids=["verbose_command", "help", "unknown_command", "no_command"])
+def test_sniff_subcommand(argv: list, expected):
+    """Tests that the command is found behind the global options."""
+
+    assert _sniff_subcommand(argv, _CMD_MODULES) == expected
+
+
+def test_parse_command():
+    """Tests that the selected command is parsed with its full subparser tree."""
+
+    argv = ["-v", "profile", "list"]
+    args = add_parser(argv).parse_args(argv)
+
+    assert args.verbose
+    assert args.func.__name__ == "_profile_list"
+
+
+def test_parse_help(capsys, monkeypatch):
+    """Tests that the help lists all commands without importing the command modules."""
+
+    for mod_path, _ in _CMD_MODULES.values():
+        monkeypatch.delitem(sys.modules, mod_path, raising=False)
+
+    with pytest.raises(SystemExit) as exc_info:
+        add_parser(["--help"]).parse_args(["--help"])
+
+    assert exc_info.value.code == 0
+    help_text = capsys.readouterr().out
+    for cmd_name, (mod_path, _) in _CMD_MODULES.items():
+        assert cmd_name in help_text
+        assert mod_path not in sys.modules
+
+
+def test_parse_unknown_command(capsys):
+    """Tests that an unknown command is rejected by the parser."""
+
+    with pytest.raises(SystemExit) as exc_info:
+        add_parser(["bogus"]).parse_args(["bogus"])
+
+    assert exc_info.value.code == 2
+    assert "invalid choice" in capsys.readouterr().err
+
+
+def _fail_add_parser(*_):
+    ''' Replaces the parser creation, which must not be called. '''
+
+    pytest.fail("The parser was created.")
+
+
+def test_main_version(monkeypatch, capsys):
+    """Tests that the version is printed without building the parser."""
+
+    monkeypatch.setattr(sys, "argv", ["pyProfileMgr", "--version"])
+    monkeypatch.setattr(main_module, "add_parser", _fail_add_parser)
+
+    assert main() == 0
+    captured = capsys.readouterr()
+    assert captured.out == f"pyProfileMgr {__version__}\n"
+    assert not captured.err
+
+
+################################################################################
+# Main
+################################################################################
@@ -0,0 +1,162 @@
+""" Tests for the profile command of the command line interface. """
+
+# BSD 3-Clause License
+#
+# Copyright (c) 2025, NewTec GmbH
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+################################################################################
+# Imports
+################################################################################
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from pyProfileMgr import profile_mgr as profile_mgr_module
+from pyProfileMgr.__main__ import add_parser, main
+from pyProfileMgr.cmd_profile import _cached_profile_names
+from pyProfileMgr.ret import Ret
+
+
+################################################################################
+# Variables
+################################################################################
+
+TEST_PROFILE_NAME = 'test_profile'
+ADD_ARGV = ["profile", "add", TEST_PROFILE_NAME, "-pt", "jira", "-s", "testServer", "-t", "testToken"]
+REMOVE_ARGV = ["profile", "remove", TEST_PROFILE_NAME]
+TEST_CERT_PATH = os.fspath(Path(__file__).resolve().parent / "test_data" / "testCertificate.cert")
+
+
+################################################################################
+# Classes
+################################################################################
+
+################################################################################
+# Functions
+################################################################################
+
+
+def _main(monkeypatch, argv: list) -> int:
+    ''' Runs the program with the command line arguments. '''
+
+    monkeypatch.setattr(sys, "argv", ["pyProfileMgr"] + argv)
+    return main()
+
+
+def _run(argv: list) -> Ret.CODE:
+    ''' Parses the command line arguments and executes the selected command. '''
+
+    args = add_parser(argv).parse_args(argv)
+    return args.func(args)
+
+
+@pytest.fixture(autouse=True)
+def profiles_folder(tmp_path, monkeypatch):
+    ''' Stores the profiles in a temporary folder per test instead of the users home directory. '''
+
+    monkeypatch.setattr(profile_mgr_module, "prepare_profiles_folder", lambda: str(tmp_path))
+    _cached_profile_names.cache_clear()
+
+    yield str(tmp_path)
+
+    _cached_profile_names.cache_clear()
+
+
+def test_profile_names_cache(profiles_folder: str):
+    """Tests that repeated adds reuse the profile names until a profile is added or removed."""
+
+    # TC: All OK - adding a profile invalidates the cached profile names.
+    assert _run(ADD_ARGV) == Ret.CODE.RET_OK
+    assert _cached_profile_names.cache_info().currsize == 0
+
+    # TC: Fail to add the existing profile again, the second attempt reuses the profile names.
+    assert _run(ADD_ARGV) == Ret.CODE.RET_ERROR_PROFILE_ALREADY_EXISTS
+    assert _run(ADD_ARGV) == Ret.CODE.RET_ERROR_PROFILE_ALREADY_EXISTS
+    assert _cached_profile_names.cache_info().hits == 1
+    assert TEST_PROFILE_NAME in _cached_profile_names(profiles_folder)
+
+    # TC: All OK - removing the profile invalidates the cached profile names, so it can be added again.
+    assert _run(REMOVE_ARGV) == Ret.CODE.RET_OK
+    assert _cached_profile_names.cache_info().currsize == 0
+    assert _run(ADD_ARGV) == Ret.CODE.RET_OK
+
+
+def test_error_output(monkeypatch, capsys):
+    """Tests that errors are reported on stderr with their return code."""
+
+    assert _main(monkeypatch, ADD_ARGV) == Ret.CODE.RET_OK
+    assert "Successfully created profile" in capsys.readouterr().out
+
+    # TC: Fail to add an existing profile, the error message is written to stderr only.
+    assert _main(monkeypatch, ADD_ARGV) == Ret.CODE.RET_ERROR_PROFILE_ALREADY_EXISTS
+    captured = capsys.readouterr()
+    assert Ret.MSG[Ret.CODE.RET_ERROR_PROFILE_ALREADY_EXISTS] in captured.err
+    assert not captured.out
+
+
+def test_invalid_profile_type(monkeypatch, capsys):
+    """Tests that argparse rejects an unknown profile type."""
+
+    argv = ["profile", "add", TEST_PROFILE_NAME, "-pt", "invalid", "-s", "testServer", "-t", "testToken"]
+
+    with pytest.raises(SystemExit) as exc_info:
+        _main(monkeypatch, argv)
+
+    assert exc_info.value.code == Ret.CODE.RET_ERROR_ARGPARSE
+    assert "invalid choice: 'invalid'" in capsys.readouterr().err
+
+
+def test_update_profile(monkeypatch, capsys):
+    """Tests the update of the certificate, the only field which can be updated."""
+
+    update_argv = ["profile", "update", TEST_PROFILE_NAME]
+
+    # TC: Fail to update a non-existing profile.
+    assert _main(monkeypatch, update_argv + ["-c", TEST_CERT_PATH]) == Ret.CODE.RET_ERROR_PROFILE_NOT_FOUND
+    assert Ret.MSG[Ret.CODE.RET_ERROR_PROFILE_NOT_FOUND] in capsys.readouterr().err
+
+    assert _main(monkeypatch, ADD_ARGV) == Ret.CODE.RET_OK
+    capsys.readouterr()
+
+    # TC: Fail to update without a field which can be updated.
+    assert _main(monkeypatch, update_argv + ["-s", "otherServer"]) == Ret.CODE.RET_ERROR_NO_UPDATE_FIELDS
+    captured = capsys.readouterr()
+    assert Ret.MSG[Ret.CODE.RET_ERROR_NO_UPDATE_FIELDS] in captured.err
+    assert not captured.out
+
+    # TC: All OK - update the certificate.
+    assert _main(monkeypatch, update_argv + ["-c", TEST_CERT_PATH]) == Ret.CODE.RET_OK
+    assert not capsys.readouterr().err
+
+
+################################################################################
+# Main
+################################################################################